@@ -22,7 +22,10 @@ class TelegramAdapter:
 
     async def _on_text(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
         if update.message and update.message.text is not None:
-            reply = await self.handle_text(update.message.text)
+            text = update.message.text
+            if not text.strip():
+                return
+            reply = await self.handle_text(text)
             if reply:
                 await update.message.reply_text(reply)
 